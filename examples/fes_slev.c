@@ -84,7 +84,10 @@ main(void)
          "Geo_Tide",
          "Rad_Tide");
 
-  for (hour = 0, time = 12053; hour < 24; hour++, time += 1 / 24.0) {
+  for (hour = 0; hour < 24; hour++) {
+    // The date is derived from the hour so that no rounding error accumulates.
+    time = 12053 + hour / 24.0;
+
     // Compute ocean tide
     if (fes_core(short_tide, lat, lon, time, &tide, &lp)) {
       // If the current point is undefined (i.e. the point is on land), the
@@ -67,25 +67,25 @@ def main():
 
     shape = lons.shape
 
-    dates = np.empty(shape, dtype='datetime64[us]')
-    dates.fill(args.date)
+    # The points are flattened once and shared by both handlers
+    lons, lats = lons.ravel(), lats.ravel()
+
+    # All points share the same date: a read-only view repeats it without
+    # allocating an array of dates.
+    dates = np.broadcast_to(np.datetime64(args.date, 'us'), lons.shape)
 
     # Create handler
-    tide, lp, _ = short_tide.calculate(lons.ravel(), lats.ravel(),
-                                       dates.ravel())
+    tide, lp, _ = short_tide.calculate(lons, lats, dates)
     tide, lp = tide.reshape(shape), lp.reshape(shape)
     if radial_tide is not None:
-        load, load_lp, _ = radial_tide.calculate(lons.ravel(), lats.ravel(),
-                                                 dates.ravel())
+        load, load_lp, _ = radial_tide.calculate(lons, lats, dates)
         load, load_lp = load.reshape(shape), load_lp.reshape(shape)
     else:
-        load = np.zeros(lons.shape)
+        load = np.zeros(shape)
         load_lp = load
 
     # Creating an image to see the result in meters
-    geo_tide = (tide + lp + load) * 0.01
-    geo_tide = geo_tide.reshape(lons.shape)
-    geo_tide = np.ma.masked_where(np.isnan(geo_tide), geo_tide)
+    geo_tide = np.ma.masked_invalid((tide + lp + load) * 0.01)
     plt.pcolormesh(geo_tide)
     plt.show()
 
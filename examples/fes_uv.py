@@ -70,24 +70,24 @@ def main():
 
     lons, lats = np.meshgrid(lons, lats)
 
-    dates = np.empty(lons.shape, dtype='datetime64[us]')
-    dates.fill(args.date)
+    # The points are flattened once and shared by both handlers
+    lons, lats = lons.ravel(), lats.ravel()
+
+    # All points share the same date: a read-only view repeats it without
+    # allocating an array of dates.
+    dates = np.broadcast_to(np.datetime64(args.date, 'us'), lons.shape)
 
     # Create handler
-    u_tide, lp, _ = eastward_velocity.calculate(lons.ravel(), lats.ravel(),
-                                                dates.ravel())
-    v_tide, _, _ = northward_velocity.calculate(lons.ravel(), lats.ravel(),
-                                                dates.ravel())
+    u_tide, lp, _ = eastward_velocity.calculate(lons, lats, dates)
+    v_tide, _, _ = northward_velocity.calculate(lons, lats, dates)
 
     # Creating an image to see the result in meters
-    u_tide = u_tide.reshape((size, size))
-    u_tide = np.ma.masked_where(np.isnan(u_tide), u_tide)
+    u_tide = np.ma.masked_invalid(u_tide.reshape((size, size)))
     plt.figure(1)
     plt.title("eastward velocity")
     plt.pcolormesh(u_tide)
 
-    v_tide = v_tide.reshape((size, size))
-    v_tide = np.ma.masked_where(np.isnan(v_tide), v_tide)
+    v_tide = np.ma.masked_invalid(v_tide.reshape((size, size)))
     plt.figure(2)
     plt.title("northward velocity")
     plt.pcolormesh(v_tide)
@@ -55,10 +55,8 @@ def main():
     radial_tide = pyfes.Handler("radial", "io", args.load.name)
 
     # Creating the time series
-    dates = np.array([
-        args.date + datetime.timedelta(seconds=item * 3600)
-        for item in range(24)
-    ])
+    dates = np.datetime64(args.date, 'us') + np.arange(24) * np.timedelta64(
+        1, 'h')
 
     lats = np.full(dates.shape, 59.195)
     lons = np.full(dates.shape, -7.688)
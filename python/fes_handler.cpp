@@ -17,6 +17,7 @@
 #include <datetime.h>
 
 #include <iostream>
+#include <map>
 
 /// Returns number of days since civil 1970-01-01.  Negative values indicate
 /// days prior to 1970-01-01.
@@ -78,33 +79,70 @@ Handler::check(const int status) const
   }
 }
 
-std::vector<std::chrono::system_clock::time_point>
+/// Converts a number of time units elapsed since 1970-01-01 into a CNES
+/// Julian day (days since 1950-01-01 00:00:00.000 UTC), the scale being the
+/// number of seconds in one time unit.
+static inline double
+julian_day(const int64_t epoch, const double scale = 1e-6)
+{
+  return ((epoch * scale) / 86400.0) + 7305;
+}
+
+/// Converts a point in time into a CNES Julian day, with a resolution of one
+/// microsecond.
+static inline double
+julian_day(const std::chrono::system_clock::time_point& time_point)
+{
+  return julian_day(std::chrono::duration_cast<std::chrono::microseconds>(
+                      time_point.time_since_epoch())
+                      .count());
+}
+
+/// Gets the number of seconds in the time unit of a numpy datetime64 type.
+static double
+datetime64_scale(const std::string& dtype)
+{
+  static const std::map<std::string, double> units{
+    { "datetime64[D]", 86400.0 }, { "datetime64[h]", 3600.0 },
+    { "datetime64[m]", 60.0 },    { "datetime64[s]", 1.0 },
+    { "datetime64[ms]", 1e-3 },   { "datetime64[us]", 1e-6 },
+    { "datetime64[ns]", 1e-9 }
+  };
+  auto it = units.find(dtype);
+  if (it == units.end()) {
+    throw std::invalid_argument(
+      "date has wrong datetime unit, expected datetime64[D], "
+      "datetime64[h], datetime64[m], datetime64[s], datetime64[ms], "
+      "datetime64[us] or datetime64[ns], got " +
+      dtype);
+  }
+  return it->second;
+}
+
+std::vector<double>
 Handler::cast_datetime(pybind11::array& array) const
 {
-  auto result = std::vector<std::chrono::system_clock::time_point>();
+  auto result = std::vector<double>();
   auto size = array.size();
-  result.reserve(size);
   auto type_num =
     pybind11::detail::array_descriptor_proxy(array.dtype().ptr())->type_num;
   if (type_num == pybind11::detail::npy_api::NPY_OBJECT_) {
+    result.reserve(size);
     for (auto& item : array) {
-      result.emplace_back(timestamp(item));
+      result.emplace_back(julian_day(timestamp(item)));
     }
   } else if (type_num == 21 /* NPY_DATETIME */) {
-    auto dtype = std::string(pybind11::str(array.dtype()));
-    if (dtype != "datetime64[us]") {
-      throw std::invalid_argument(
-        "date has wrong datetime unit, expected datetime64[us], "
-        "got " +
-        dtype);
-    }
-    pybind11::array_t<int64_t> data = array;
-    auto _data = data.unchecked<1>();
-    for (pybind11::ssize_t ix = 0; ix < size; ++ix) {
-      auto epoch = _data[ix];
-      result.emplace_back(
-        std::chrono::system_clock::from_time_t(epoch / 1'000'000) +
-        std::chrono::microseconds(epoch % 1'000'000));
+    auto scale = datetime64_scale(std::string(pybind11::str(array.dtype())));
+    // datetime64 values are stored as 64-bit integers: they are read in place
+    // rather than through a copy converted to an int64 array.
+    auto _data = array.unchecked<int64_t, 1>();
+    result.resize(size);
+    {
+      // The numerical conversion does not need the Python API.
+      pybind11::gil_scoped_release gil;
+      for (pybind11::ssize_t ix = 0; ix < size; ++ix) {
+        result[ix] = julian_day(_data[ix], scale);
+      }
     }
   }
   return result;
@@ -146,20 +184,10 @@ Handler::Handler(const std::string& tide,
 }
 
 std::tuple<double, double, int>
-Handler::calculate(const double lon,
-                   const double lat,
-                   const std::chrono::system_clock::time_point& date) const
+Handler::calculate(const double lon, const double lat, const double time) const
 {
   double h, h_long_period;
-  auto epoch = std::chrono::duration_cast<std::chrono::microseconds>(
-                 date.time_since_epoch())
-                 .count();
-  auto status = fes_core(fes_.get(),
-                         lat,
-                         lon,
-                         ((epoch * 1e-6) / 86400.0) + 7305,
-                         &h,
-                         &h_long_period);
+  auto status = fes_core(fes_.get(), lat, lon, time, &h, &h_long_period);
   if (status == 1) {
     if (fes_errno(fes_.get()) == FES_NO_DATA) {
       return std::make_tuple(std::numeric_limits<double>::quiet_NaN(),
@@ -171,10 +199,37 @@ Handler::calculate(const double lon,
   return std::make_tuple(h, h_long_period, fes_min_number(fes_.get()));
 }
 
+/// Gets the array storing one of the results of the tidal calculation: a new
+/// array, or the buffer provided by the caller if any.
+static pybind11::array_t<double>
+output_array(const pybind11::object& out,
+             const size_t ix,
+             const pybind11::ssize_t size)
+{
+  if (out.is_none()) {
+    return pybind11::array_t<double>(pybind11::array::ShapeContainer{ size });
+  }
+  auto item = pybind11::reinterpret_borrow<pybind11::tuple>(out)[ix];
+  if (!pybind11::isinstance<pybind11::array_t<double>>(item)) {
+    throw std::invalid_argument("out must contain numpy.ndarray of float64");
+  }
+  auto result = pybind11::reinterpret_borrow<pybind11::array_t<double>>(item);
+  if (result.ndim() != 1 || result.size() != size) {
+    throw std::invalid_argument(
+      "out must contain one-dimensional arrays of shape (" +
+      std::to_string(size) + ",)");
+  }
+  if (!result.writeable()) {
+    throw std::invalid_argument("out must contain writeable arrays");
+  }
+  return result;
+}
+
 pybind11::tuple
 Handler::calculate(pybind11::array_t<double>& lon,
                    pybind11::array_t<double>& lat,
-                   pybind11::array& date)
+                   pybind11::array& date,
+                   const pybind11::object& out)
 {
   // arrays must one-dimensionnal
   if (lon.ndim() != 1) {
@@ -201,7 +256,9 @@ Handler::calculate(pybind11::array_t<double>& lon,
       std::to_string(size) + ",) (" + std::to_string(date.size()) + ",)");
   }
 
-  // Cast python date to C++ objects
+  // Cast python date to CNES Julian days. Only the conversion of
+  // datetime.datetime objects needs the GIL, the tidal computation below is
+  // performed without it.
   auto _date = cast_datetime(date);
   if (_date.size() == 0) {
     throw std::invalid_argument(
@@ -209,14 +266,17 @@ Handler::calculate(pybind11::array_t<double>& lon,
       " 1. calculate(self, numpy.ndarray[m, 1], numpy.ndarray[m, 1], "
       "numpy.ndarray[datetime.datetime[m, 1]])\n"
       " 2. calculate(self, numpy.ndarray[m, 1], numpy.ndarray[m, 1], "
-      "numpy.ndarray[datetime64[us][m, 1]])");
+      "numpy.ndarray[datetime64[m, 1]])");
   }
 
-  // Allocates results
-  pybind11::array_t<double> h(pybind11::array::ShapeContainer{ size });
-  pybind11::array_t<double> h_long_period(
-    pybind11::array::ShapeContainer{ size });
-  pybind11::array_t<double> samples(pybind11::array::ShapeContainer{ size });
+  // Allocates results, unless the caller provides the buffers to fill
+  if (!out.is_none() && (!pybind11::isinstance<pybind11::tuple>(out) ||
+                         pybind11::len(out) != 3)) {
+    throw std::invalid_argument("out must be a tuple of three arrays");
+  }
+  auto h = output_array(out, 0, size);
+  auto h_long_period = output_array(out, 1, size);
+  auto samples = output_array(out, 2, size);
 
   auto _lon = lon.unchecked<1>();
   auto _lat = lat.unchecked<1>();
@@ -31,13 +31,11 @@ private:
 
   void check(int status) const;
 
-  std::vector<std::chrono::system_clock::time_point> cast_datetime(
-    pybind11::array& array) const;
+  std::vector<double> cast_datetime(pybind11::array& array) const;
 
-  std::tuple<double, double, int> calculate(
-    const double lon,
-    const double lat,
-    const std::chrono::system_clock::time_point& date) const;
+  std::tuple<double, double, int> calculate(const double lon,
+                                            const double lat,
+                                            const double time) const;
 
 public:
   Handler(const std::string& tide,
@@ -69,5 +67,6 @@ public:
 
   pybind11::tuple calculate(pybind11::array_t<double>& lon,
                             pybind11::array_t<double>& lat,
-                            pybind11::array& date);
+                            pybind11::array& date,
+                            const pybind11::object& out);
 };
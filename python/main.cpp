@@ -21,16 +21,31 @@ namespace py = pybind11;
 PYBIND11_MODULE(pyfes, m)
 {
   py::class_<Handler>(m, "Handler")
-    .def(py::init<const std::string&, const std::string&, const std::string&>())
-    .def_static("dump_template", &Handler::dump_template, py::arg("path"))
-    .def("set_buffer_size", &Handler::set_buffer_size, py::arg("size"))
-    .def("calculate",
-         [](Handler& self,
-            py::array_t<double>& lon,
-            py::array_t<double>& lat,
-            py::array& date) -> py::tuple {
-           return self.calculate(lon, lat, date);
-         });
+    // Loading the grids, writing the template and resizing the buffer only
+    // involve the C library: the GIL is released while they run.
+    .def(py::init<const std::string&, const std::string&, const std::string&>(),
+         py::call_guard<py::gil_scoped_release>())
+    .def_static("dump_template",
+                &Handler::dump_template,
+                py::arg("path"),
+                py::call_guard<py::gil_scoped_release>())
+    .def("set_buffer_size",
+         &Handler::set_buffer_size,
+         py::arg("size"),
+         py::call_guard<py::gil_scoped_release>())
+    .def(
+      "calculate",
+      [](Handler& self,
+         py::array_t<double>& lon,
+         py::array_t<double>& lat,
+         py::array& date,
+         const py::object& out) -> py::tuple {
+        return self.calculate(lon, lat, date, out);
+      },
+      py::arg("lon"),
+      py::arg("lat"),
+      py::arg("date"),
+      py::arg("out") = py::none());
 
   m.attr("__version__") = "2.9.4.dev13";
 }
@@ -16,6 +16,7 @@
 """This script is the entry point for building, distributing and installing
 this module using distutils/setuptools."""
 from typing import ClassVar, List, Optional
+import functools
 import os
 import pathlib
 import platform
@@ -37,6 +38,15 @@ MINOR = sys.version_info[1]
 # Versioning tag
 PATTERN = "#define FES_VERSION"
 
+# Version number defined in the header file
+VERSION_RE = re.compile(PATTERN + r' "(.*)"')
+
+# Output of "git describe": tag, number of commits since the tag and state
+DESCRIBE_RE = re.compile(r'([\w\d\.]+)-(\d+)-g[\w\d]+(?:-(dirty))?')
+
+# Output of "git describe" when the repository has no tag
+COMMIT_RE = re.compile(r'[\w\d]+(?:-(dirty))?')
+
 # Working directory
 WORKING_DIRECTORY = pathlib.Path(__file__).parent.absolute()
 
@@ -56,28 +66,29 @@ def build_dirname(extname=None):
 def execute(cmd):
     """Executes a command and returns the lines displayed on the standard
     output"""
-    process = subprocess.Popen(cmd,
-                               shell=True,
-                               stdout=subprocess.PIPE,
-                               stderr=subprocess.PIPE)
-    stream = process.stdout
-    assert stream is not None
-    return stream.read().decode()
+    process = subprocess.run(cmd,
+                             stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE,
+                             check=False)
+    return process.stdout.decode()
 
 
 def update_version(path, version, pattern, replaced_line):
     """Updating the version number description"""
     with open(path, "r") as stream:
         lines = stream.readlines()
-    pattern = re.compile(pattern)
+    regex = re.compile(pattern)
 
-    for idx, line in enumerate(lines):
-        match = pattern.search(line)
-        if match is not None:
-            lines[idx] = replaced_line % version
+    updated = [
+        line if regex.search(line) is None else replaced_line % version
+        for line in lines
+    ]
 
-    with open(path, "w") as stream:
-        stream.write("".join(lines))
+    # The file is left untouched if the version has not changed, so that its
+    # modification time does not trigger a new build.
+    if updated != lines:
+        with open(path, "w") as stream:
+            stream.write("".join(updated))
 
 
 def update_meta(path, version):
@@ -92,6 +103,7 @@ def update_python_module(path, version):
                    'm.attr("__version__") = "%s";\n')
 
 
+@functools.lru_cache(maxsize=None)
 def revision():
     """Returns the software version."""
     os.chdir(WORKING_DIRECTORY)
@@ -100,21 +112,19 @@ def revision():
     # If the ".git" directory exists, this function is executed in the
     # development environment, otherwise it's a release.
     if not pathlib.Path(WORKING_DIRECTORY, '.git').exists():
-        pattern = re.compile(PATTERN + r' "(.*)"').search
         with open(path, "r") as stream:
             for line in stream:
-                match = pattern(line)
+                match = VERSION_RE.search(line)
                 if match is not None:
                     return match.group(1)
         raise AssertionError()
 
-    stdout = execute("git describe --tags --dirty --long --always").strip()
-    pattern = re.compile(r'([\w\d\.]+)-(\d+)-g[\w\d]+(?:-(dirty))?')
-    match = pattern.search(stdout)
+    stdout = execute(
+        ["git", "describe", "--tags", "--dirty", "--long", "--always"]).strip()
+    match = DESCRIBE_RE.search(stdout)
     if match is None:
         # No tag found, use the last commit
-        pattern = re.compile(r'[\w\d]+(?:-(dirty))?')
-        match = pattern.search(stdout)
+        match = COMMIT_RE.search(stdout)
         assert match is not None, f"Unable to parse git output {stdout!r}"
         version = "0.0"
     else:
@@ -123,16 +133,7 @@ def revision():
         if commits != 0:
             version += f".dev{commits}"
 
-    with open(path, "r") as stream:
-        lines = stream.readlines()
-
-    for idx, line in enumerate(lines):
-        if PATTERN in line:
-            lines[idx] = PATTERN + " \"%s\"\n" % version
-
-    with open(path, "w") as stream:
-        stream.writelines(lines)
-
+    update_version(path, version, PATTERN, PATTERN + " \"%s\"\n")
     update_meta(WORKING_DIRECTORY.joinpath("conda", "meta.yaml"), version)
     update_python_module(WORKING_DIRECTORY.joinpath("python", "main.cpp"),
                          version)
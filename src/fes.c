@@ -124,12 +124,6 @@ _get_env(fes_handler* handle)
   return (size_t)value;
 }
 
-#define DUPLICATE_KEY(type, key, keyword)                                      \
-  (key) = STRDUP(_get_key(type, fes->waves[ix].name, (keyword)));              \
-  if ((key) == NULL) {                                                         \
-    goto error;                                                                \
-  }
-
 /*
  _delete_string_list
 
@@ -151,38 +145,52 @@ _delete_string_list(char** list)
 /*
  _known_keys
 
- Creation of the list of keywords known by the program.
+ Creation of the list of keywords known by the program. The list, ended by a
+ NULL pointer, and the keywords are stored in a single memory block, to be
+ released with free.
 
  Returns the list of keys known by the program.
 */
 static char**
 _known_keys(fes_handler* fes)
 {
-#define SIZE (N_WAVES * 10 + 1)
+#define N_KEYS (N_WAVES * 10)
+  static const fes_enum_tide_type types[] = { FES_TIDE, FES_RADIAL };
+  static const char* const keywords[] = {
+    KW_FILE, KW_LATITUDE, KW_LONGITUDE, KW_AMPLITUDE, KW_PHASE
+  };
   char** keys;
-  size_t ix, jx;
-
-  if ((keys = (char**)calloc(SIZE, sizeof(char*))) == NULL) {
+  char* ptr;
+  size_t size = 0;
+  size_t ix, jx, kx, n = 0;
+
+  /* Computes the memory needed to store the keywords */
+  for (ix = 0; ix < N_WAVES; ++ix)
+    for (jx = 0; jx < 2; ++jx)
+      for (kx = 0; kx < 5; ++kx)
+        size +=
+          strlen(_get_key(types[jx], fes->waves[ix].name, keywords[kx])) + 1;
+
+  if ((keys = (char**)malloc((N_KEYS + 1) * sizeof(char*) + size)) == NULL) {
     return NULL;
   }
 
-  for (ix = 0, jx = 0; ix < N_WAVES; ++ix, jx += 10) {
-    DUPLICATE_KEY(FES_TIDE, keys[jx], KW_FILE);
-    DUPLICATE_KEY(FES_TIDE, keys[jx + 1], KW_LATITUDE);
-    DUPLICATE_KEY(FES_TIDE, keys[jx + 2], KW_LONGITUDE);
-    DUPLICATE_KEY(FES_TIDE, keys[jx + 3], KW_AMPLITUDE);
-    DUPLICATE_KEY(FES_TIDE, keys[jx + 4], KW_PHASE);
-    DUPLICATE_KEY(FES_RADIAL, keys[jx + 5], KW_FILE);
-    DUPLICATE_KEY(FES_RADIAL, keys[jx + 6], KW_LATITUDE);
-    DUPLICATE_KEY(FES_RADIAL, keys[jx + 7], KW_LONGITUDE);
-    DUPLICATE_KEY(FES_RADIAL, keys[jx + 8], KW_AMPLITUDE);
-    DUPLICATE_KEY(FES_RADIAL, keys[jx + 9], KW_PHASE);
+  /* The keywords are stored after the list of pointers */
+  ptr = (char*)(keys + N_KEYS + 1);
+  for (ix = 0; ix < N_WAVES; ++ix) {
+    for (jx = 0; jx < 2; ++jx) {
+      for (kx = 0; kx < 5; ++kx) {
+        const char* key =
+          _get_key(types[jx], fes->waves[ix].name, keywords[kx]);
+        size = strlen(key) + 1;
+        memcpy(ptr, key, size);
+        keys[n++] = ptr;
+        ptr += size;
+      }
+    }
   }
+  keys[n] = NULL;
   return keys;
-
-error:
-  _delete_string_list(keys);
-  return NULL;
 }
 
 /*
@@ -270,7 +278,7 @@ _check_ini(fes_handler* fes, void* ini)
     rc = 0;
   }
 error:
-  _delete_string_list(keys);
+  free(keys);
   _delete_string_list(unhandled_keys);
   free(buffer);
   return rc;
@@ -290,6 +298,8 @@ fes_new(FES* handle,
   size_t size;
   fes_handler* fes;
   void* ini = NULL;
+  const char* filenames[N_WAVES];
+  float* buffer = NULL;
 
   /* Allocate handle */
   if ((fes = (fes_handler*)calloc(1, sizeof(fes_handler))) == NULL) {
@@ -312,11 +322,13 @@ fes_new(FES* handle,
   if (_check_ini(fes, ini))
     goto error;
 
-  /* Determines the number of grid has to be loaded into memory */
+  /* Determines the number of grid has to be loaded into memory. The grid
+   * file of each wave is looked up only once, and reused when the grids are
+   * loaded. */
   for (ix = 0; ix < N_WAVES; ++ix) {
-    /* Get key name for current wave */
-    if (ini_get_string(
-          ini, _get_key(fes->type, fes->waves[ix].name, "FILE"), NULL) != NULL)
+    filenames[ix] = ini_get_string(
+      ini, _get_key(fes->type, fes->waves[ix].name, "FILE"), NULL);
+    if (filenames[ix] != NULL)
       fes->grid.n_grids++;
   }
 
@@ -354,15 +366,6 @@ fes_new(FES* handle,
     dlist_init(&fes->grid.buffer->list, fes_delete_cache_item);
   }
 
-  if (mode == FES_MEM) {
-    /* to read data from memory */
-    if ((fes->grid.values = (fes_float_complex**)calloc(
-           fes->grid.n_grids, sizeof(fes_float_complex*))) == NULL) {
-      set_fes_error(fes, FES_NO_MEMORY);
-      goto error;
-    }
-  }
-
   if ((fes->grid.waveIndex = (int*)calloc(fes->grid.n_grids, sizeof(int))) ==
       NULL) {
     set_fes_error(fes, FES_NO_MEMORY);
@@ -372,8 +375,7 @@ fes_new(FES* handle,
   /* Loading grids */
   for (ix = 0; ix < N_WAVES; ++ix) {
     fes_cdf_file file;
-    const char* filename = _translate_path((char*)(ini_get_string(
-      ini, _get_key(fes->type, fes->waves[ix].name, "FILE"), NULL)));
+    const char* filename = _translate_path((char*)(filenames[ix]));
 
     if (filename == NULL) {
       /* Wave computed by admittance or not computed */
@@ -416,7 +418,7 @@ fes_new(FES* handle,
             sizeof(file.pha));
 
     /* loading netCDF grid */
-    if ((rc = load_grid(filename, n, &file, fes)) != 0)
+    if ((rc = load_grid(filename, n, &file, fes, &buffer)) != 0)
       goto error;
 
     fes->grid.waveIndex[n] = ix;
@@ -436,6 +438,9 @@ fes_new(FES* handle,
    */
   fes->west_lon = fes->east_lon = fes->south_lat = fes->north_lat = nan("NaN");
 
+  /* No long-period tidal potential, nor phase, has been computed yet. */
+  fes->lpe_time = fes->phase_time = nan("NaN");
+
   goto finish;
 
 error:
@@ -443,6 +448,7 @@ error:
     rc = 1;
 
 finish:
+  free(buffer);
   ini_close(ini);
   return rc;
 }
@@ -482,9 +488,6 @@ fes_delete(FES handle)
     for (ix = 0; ix < fes->grid.n_grids; ++ix) {
       if (fes->grid.file != NULL)
         nc_close(fes->grid.file[ix].id);
-
-      if (fes->grid.values != NULL)
-        free(fes->grid.values[ix]);
     }
     if (fes->grid.buffer != NULL) {
       fes_cache_item *current_item, *tmp;
@@ -501,6 +504,70 @@ fes_delete(FES handle)
   }
 }
 
+/*
+ _long_period_tide
+
+ Computes the long-period equilibrium ocean tide. The tidal potentials only
+ depend on time, they are computed again only if the requested time changes.
+
+ fes FES handler
+ time Julian day (days since 1950-01-01 00:00:00.000 UTC)
+ lat Latitude in degrees (positive north)
+ h_long_period Computed long-period tide (in centimeters)
+ */
+static void
+_long_period_tide(fes_handler* const fes,
+                  const double time,
+                  const double lat,
+                  double* h_long_period)
+{
+  if (fes->type != FES_TIDE) {
+    *h_long_period = 0;
+    return;
+  }
+
+  if (fes->lpe_time != time) {
+    lpe_potential((const float(*)[N_COEFS])(fes->w2nd),
+                  (const float(*)[N_COEFS])(fes->w3rd),
+                  time,
+                  &fes->h20,
+                  &fes->h30);
+    fes->lpe_time = time;
+  }
+  *h_long_period = lpe_tide(fes->h20, fes->h30, lat);
+}
+
+/*
+ _set_phases
+
+ Computes the cosine and sine of the phase of each wave. The phases only
+ depend on time, they are computed again only if the requested time changes.
+
+ fes FES handler
+ time Julian day (days since 1950-01-01 00:00:00.000 UTC)
+ delta Time elapsed since the nodal corrections were computed (in hours)
+ */
+static void
+_set_phases(fes_handler* const fes, const double time, const double delta)
+{
+  int ix;
+  double phi;
+
+  if (fes->phase_time == time)
+    return;
+
+  for (ix = 0; ix < N_WAVES; ++ix) {
+    phi = fmod(fes->waves[ix].freq * delta + fes->waves[ix].v0u, 2.0 * M_PI);
+
+    if (phi < 0.0)
+      phi = phi + 2.0 * M_PI;
+
+    fes->waves[ix].cos_phi = cos(phi);
+    fes->waves[ix].sin_phi = sin(phi);
+  }
+  fes->phase_time = time;
+}
+
 /*
  */
 int
@@ -512,7 +579,6 @@ fes_core(FES handle,
          double* h_long_period)
 {
   int ix;
-  double phi;
   double t1 = julian_centuries(time);
   double delta;
   fes_handler* fes = (fes_handler*)handle;
@@ -524,6 +590,9 @@ fes_core(FES handle,
 
     fes->nodal_time = t1;
     delta = 0.0;
+
+    /* The phases of the waves depend on the nodal corrections. */
+    fes->phase_time = nan("NaN");
   }
 
   if (interp(fes, lat, lon))
@@ -534,25 +603,14 @@ fes_core(FES handle,
   if (fes->is_data) {
     *h = 0.0;
 
-    if (fes->type == FES_TIDE) {
-      lpe_minus_n_waves((const float(*)[N_COEFS])(fes->w2nd),
-                        (const float(*)[N_COEFS])(fes->w3rd),
-                        time,
-                        lat,
-                        h_long_period);
-    } else
-      *h_long_period = 0;
+    _long_period_tide(fes, time, lat, h_long_period);
+    _set_phases(fes, time, delta);
 
     for (ix = 0; ix < N_WAVES; ++ix) {
       double tide;
 
-      phi = fmod(fes->waves[ix].freq * delta + fes->waves[ix].v0u, 2.0 * M_PI);
-
-      if (phi < 0.0)
-        phi = phi + 2.0 * M_PI;
-
-      tide = fes->waves[ix].f *
-             (fes->waves[ix].c.re * cos(phi) + fes->waves[ix].c.im * sin(phi));
+      tide = fes->waves[ix].f * (fes->waves[ix].c.re * fes->waves[ix].cos_phi +
+                                 fes->waves[ix].c.im * fes->waves[ix].sin_phi);
 
       if (fes->waves[ix].type == SP_TIDE)
         *h += tide;
@@ -562,14 +620,7 @@ fes_core(FES handle,
   } else {
     *h = nan("nan");
 
-    if (fes->type == FES_TIDE) {
-      lpe_minus_n_waves((const float(*)[N_COEFS])(fes->w2nd),
-                        (const float(*)[N_COEFS])(fes->w3rd),
-                        time,
-                        lat,
-                        h_long_period);
-    } else
-      *h_long_period = 0;
+    _long_period_tide(fes, time, lat, h_long_period);
     set_fes_error(fes, FES_NO_DATA);
     return 1;
   }
@@ -625,6 +676,6 @@ error:
   if (stream != NULL)
     fclose(stream);
   fes_delete(fes);
-  _delete_string_list(keys);
+  free(keys);
   return rc;
 }
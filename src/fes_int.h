@@ -624,6 +624,10 @@ struct _fes_wave
   double f;
   /** Tide value. */
   fes_double_complex c;
+  /** Cosine of the wave phase at the time of the last tide computed. */
+  double cos_phi;
+  /** Sine of the wave phase at the time of the last tide computed. */
+  double sin_phi;
   /** Harmonic constituents (T, s, h, p, N′, p₁, shift, ξ, ν, ν′, ν″) */
   short argument[N_CONSTITUENTS];
 };
@@ -763,9 +767,10 @@ struct _fes_grid
   int* waveIndex;
   /** Array that contains the opened grids. */
   fes_cdf_file* file;
-  /** Array that contains n_grids matrix of dimension
-   lat_dim * lon_dim that contains tide values. */
-  fes_float_complex** values;
+  /** Matrix of dimension lat_dim * lon_dim that contains, for each cell, the
+   tide values of the n_grids grids. The values of a cell are contiguous so
+   that reading a point of the grids loads as few cache lines as possible. */
+  fes_float_complex* values;
   /** Buffer used to cache the values read in netCDF files */
   fes_buffer* buffer;
 };
@@ -822,6 +827,15 @@ struct _fes_handler
   float w2nd[N_WAVES_2ND][N_COEFS];
   /** table with 3rd order LPequi waves */
   float w3rd[N_WAVES_3RD][N_COEFS];
+  /** Time of the last long-period tidal potentials computed (CNES Julian
+   day) */
+  double lpe_time;
+  /** Tidal potential V20 of the long-period waves at lpe_time */
+  double h20;
+  /** Tidal potential V30 of the long-period waves at lpe_time */
+  double h30;
+  /** Time of the phases of the waves computed (CNES Julian day) */
+  double phase_time;
 
   /** Tide grids read */
   fes_grid grid;
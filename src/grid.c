@@ -49,6 +49,11 @@ _normalize_longitude(const double base, const double lon)
 {
   register double result = lon;
 
+  /* Longitudes several turns away from the base are first brought within
+   * one turn of it, so that the loops below iterate at most once. */
+  if (fabs(result - base) > 720.0)
+    result = base + fmod(result - base, 360.0);
+
   while (result >= ((base + 360.0) - EPSILON))
     result -= 360.0;
   while (result < base - EPSILON)
@@ -59,25 +64,6 @@ _normalize_longitude(const double base, const double lon)
   return result;
 }
 
-/*
- _nearest_integer
-
- Whole part of a real.
-
- x Real value
-
- Returns whole part.
- */
-static double
-_nearest_integer(const double x)
-{
-  double integral;
-
-  modf(x, &integral);
-
-  return integral;
-}
-
 /*
  _get_index
 
@@ -88,11 +74,14 @@ _nearest_integer(const double x)
  step Step
 
  Returns computed index.
+
+ The value is never less than min, so the conversion to an unsigned integer
+ truncates the quotient to its whole part.
  */
 static size_t
 _get_index(const double min, const double value, const double step)
 {
-  return (size_t)(_nearest_integer((value - min) / step));
+  return (size_t)((value - min) / step);
 }
 
 /*
@@ -184,8 +173,10 @@ _read_grid_value(fes_handler* const fes,
   }
   /* reading values from memory */
   else {
-    z = grid->transpose ? grid->values[n][i_lon * grid->lat_dim + i_lat]
-                        : grid->values[n][i_lat * grid->lon_dim + i_lon];
+    size_t index = grid->transpose ? i_lon * grid->lat_dim + i_lat
+                                   : i_lat * grid->lon_dim + i_lon;
+
+    z = grid->values[index * grid->n_grids + n];
 
     if (z.re == grid->undef || z.im == grid->undef) {
       value->re = DV;
@@ -491,6 +482,10 @@ interp(fes_handler* fes, const double lat, const double lon)
 {
   int number;
   size_t n;
+  double w_11;
+  double w_21;
+  double w_12;
+  double w_22;
   fes_double_complex c;
 
   if (!CONTAINS(fes->west_lon, lon, fes->east_lon) ||
@@ -505,40 +500,48 @@ interp(fes_handler* fes, const double lat, const double lon)
 
   fes->min_number = 4;
 
+  /* The interpolation weights are the same for all the grids */
+  bilinear_weights(fes->west_lon,  /* X1 */
+                   fes->east_lon,  /* X2 */
+                   fes->south_lat, /* Y1 */
+                   fes->north_lat, /* Y2 */
+                   lon,
+                   lat,
+                   &w_11,
+                   &w_21,
+                   &w_12,
+                   &w_22);
+
   /* Interpolation */
   for (n = 0; n < fes->grid.n_grids; ++n) {
     if (fes->sw[n].re == DV && fes->se[n].re == DV && fes->nw[n].re == DV &&
         fes->ne[n].re == DV)
       goto no_data;
 
-    number = bilinear_interp(fes->west_lon,  /* X1 */
-                             fes->east_lon,  /* X2 */
-                             fes->south_lat, /* Y1 */
-                             fes->north_lat, /* Y2 */
-                             fes->sw[n].re,  /* X1, Y1 */
-                             fes->se[n].re,  /* X2, Y1 */
-                             fes->nw[n].re,  /* X1, Y2 */
-                             fes->ne[n].re,  /* X2, Y2 */
-                             lon,
-                             lat,
-                             &c.re);
+    number = bilinear_interp_weighted(w_11,
+                                      w_21,
+                                      w_12,
+                                      w_22,
+                                      fes->sw[n].re, /* X1, Y1 */
+                                      fes->se[n].re, /* X2, Y1 */
+                                      fes->nw[n].re, /* X1, Y2 */
+                                      fes->ne[n].re, /* X2, Y2 */
+                                      &c.re);
 
     if (c.re == DV)
       goto no_data;
 
     fes->min_number = MIN(fes->min_number, number);
 
-    number = bilinear_interp(fes->west_lon,  /* X1 */
-                             fes->east_lon,  /* X2 */
-                             fes->south_lat, /* Y1 */
-                             fes->north_lat, /* Y2 */
-                             fes->sw[n].im,  /* X1, Y1 */
-                             fes->se[n].im,  /* X2, Y1 */
-                             fes->nw[n].im,  /* X1, Y2 */
-                             fes->ne[n].im,  /* X2, Y2 */
-                             lon,
-                             lat,
-                             &c.im);
+    number = bilinear_interp_weighted(w_11,
+                                      w_21,
+                                      w_12,
+                                      w_22,
+                                      fes->sw[n].im, /* X1, Y1 */
+                                      fes->se[n].im, /* X2, Y1 */
+                                      fes->nw[n].im, /* X1, Y2 */
+                                      fes->ne[n].im, /* X2, Y2 */
+                                      &c.im);
 
     if (c.im == DV)
       goto no_data;
@@ -562,7 +565,8 @@ int
 load_grid(const char* const path,
           const unsigned int n,
           fes_cdf_file* const nc,
-          fes_handler* const fes)
+          fes_handler* const fes,
+          float** const buffer)
 {
   int rc;
   size_t lon_dim;
@@ -607,30 +611,42 @@ load_grid(const char* const path,
              fes->grid.undef != undef) {
     set_fes_extended_error(
       fes, FES_IO_ERROR, "The definition of grids isn't constant : %s", path);
+    nc_close(nc->id);
+    return 1;
   }
 
   /* Loading grid into memory */
-  if (fes->grid.values != NULL) {
+  if (fes->grid.file == NULL) {
     size_t ix;
     size_t size = lat_dim * lon_dim;
     float* amp;
     float* pha;
-
-    /* Allocate the current grid */
-    if ((fes->grid.values[n] = (fes_float_complex*)calloc(
-           size, sizeof(fes_float_complex))) == NULL) {
-      set_fes_error(fes, FES_NO_MEMORY);
-      return 1;
+    fes_float_complex* values;
+
+    /* Allocate the grids when the first one is loaded. The grids and the
+     * buffer used to read the amplitudes and phases are entirely overwritten
+     * below, so they are not cleared on allocation. */
+    if (n == 0) {
+      if ((fes->grid.values = (fes_float_complex*)malloc(
+             size * fes->grid.n_grids * sizeof(fes_float_complex))) == NULL) {
+        set_fes_error(fes, FES_NO_MEMORY);
+        nc_close(nc->id);
+        return 1;
+      }
     }
 
-    amp = (float*)calloc(size, sizeof(float));
-    pha = (float*)calloc(size, sizeof(float));
-    if (amp == NULL || pha == NULL) {
-      free(amp);
-      free(pha);
-      set_fes_error(fes, FES_NO_MEMORY);
-      return 1;
+    /* All the grids have the same size: the buffer used to read the
+     * amplitudes and phases is allocated by the first grid loaded and
+     * reused by the following ones. */
+    if (*buffer == NULL) {
+      if ((*buffer = (float*)malloc(2 * size * sizeof(float))) == NULL) {
+        set_fes_error(fes, FES_NO_MEMORY);
+        nc_close(nc->id);
+        return 1;
+      }
     }
+    amp = *buffer;
+    pha = *buffer + size;
 
     /* reading all values */
     rc = nc_get_var_float(nc->id, nc->amp_id, amp);
@@ -648,25 +664,27 @@ load_grid(const char* const path,
                                path);
     }
 
+    /* The grid is now in memory, the file is no longer needed. Closing it
+     * releases its descriptor and the metadata and chunk caches held by the
+     * netCDF library for each of the grids loaded. */
+    nc_close(nc->id);
+
     /* if an error was caught */
-    if (rc) {
-      free(amp);
-      free(pha);
+    if (rc)
       return 1;
-    }
 
-    for (ix = 0; ix < size; ++ix) {
+    /* The values of the current grid are interleaved with those of the
+     * other grids */
+    for (ix = 0, values = fes->grid.values + n; ix < size;
+         ++ix, values += fes->grid.n_grids) {
       if (amp[ix] != undef && pha[ix] != undef) {
-        fes->grid.values[n][ix].re = amp[ix] * (float)(cos(pha[ix] * RAD));
-        fes->grid.values[n][ix].im = amp[ix] * (float)(sin(pha[ix] * RAD));
+        values->re = amp[ix] * (float)(cos(pha[ix] * RAD));
+        values->im = amp[ix] * (float)(sin(pha[ix] * RAD));
       } else {
-        fes->grid.values[n][ix].re = (float)(undef);
-        fes->grid.values[n][ix].im = (float)(undef);
+        values->re = (float)(undef);
+        values->im = (float)(undef);
       }
     }
-
-    free(amp);
-    free(pha);
   } else {
     fes->grid.file[n] = *nc;
   }
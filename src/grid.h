@@ -42,6 +42,9 @@ interp(fes_handler* fes, const double lat, const double lon);
  @param n Index of the current grid
  @param nc Properties of netCDF read
  @param fes Properties of grid read
+ @param buffer Buffer used to read the values of the grids loaded into
+  memory. It is allocated by the first call if it points to NULL, reused by
+  the following calls, and must be released by the caller.
 
  @return 0 on success or 1 on failure.
  */
@@ -49,4 +52,5 @@ int
 load_grid(const char* const path,
           const unsigned int n,
           fes_cdf_file* const nc,
-          fes_handler* const fes);
+          fes_handler* const fes,
+          float** const buffer);
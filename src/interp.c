@@ -82,6 +82,61 @@ _sum_weighting(const double x_12, const double w_12, double* s, double* w)
   return 0;
 }
 
+/*
+ */
+void
+bilinear_weights(const double x_1,
+                 const double x_2,
+                 const double y_1,
+                 const double y_2,
+                 const double x,
+                 const double y,
+                 double* w_11,
+                 double* w_21,
+                 double* w_12,
+                 double* w_22)
+{
+  double w_x1;
+  double w_x2;
+  double w_y1;
+  double w_y2;
+
+  _linear_weighting(x, x_1, x_2, &w_x1, &w_x2);
+  _linear_weighting(y, y_1, y_2, &w_y1, &w_y2);
+
+  *w_11 = w_x1 * w_y1;
+  *w_21 = w_x2 * w_y1;
+  *w_12 = w_x1 * w_y2;
+  *w_22 = w_x2 * w_y2;
+}
+
+/*
+ */
+int
+bilinear_interp_weighted(const double w_11,
+                         const double w_21,
+                         const double w_12,
+                         const double w_22,
+                         const double value_11,
+                         const double value_21,
+                         const double value_12,
+                         const double value_22,
+                         double* z)
+{
+  int n = 0;
+  double w = 0.0;
+  double s = 0.0;
+
+  n = _sum_weighting(value_11, w_11, &s, &w);
+  n += _sum_weighting(value_12, w_12, &s, &w);
+  n += _sum_weighting(value_21, w_21, &s, &w);
+  n += _sum_weighting(value_22, w_22, &s, &w);
+
+  *z = w == 0.0 ? DV : s / w;
+
+  return n;
+}
+
 /*
  */
 int
@@ -97,23 +152,13 @@ bilinear_interp(const double x_1,
                 const double y,
                 double* z)
 {
-  int n = 0;
-  double w = 0.0;
-  double s = 0.0;
-  double w_x1;
-  double w_x2;
-  double w_y1;
-  double w_y2;
-
-  _linear_weighting(x, x_1, x_2, &w_x1, &w_x2);
-  _linear_weighting(y, y_1, y_2, &w_y1, &w_y2);
+  double w_11;
+  double w_21;
+  double w_12;
+  double w_22;
 
-  n = _sum_weighting(value_11, w_x1 * w_y1, &s, &w);
-  n += _sum_weighting(value_12, w_x1 * w_y2, &s, &w);
-  n += _sum_weighting(value_21, w_x2 * w_y1, &s, &w);
-  n += _sum_weighting(value_22, w_x2 * w_y2, &s, &w);
+  bilinear_weights(x_1, x_2, y_1, y_2, x, y, &w_11, &w_21, &w_12, &w_22);
 
-  *z = w == 0.0 ? DV : s / w;
-
-  return n;
+  return bilinear_interp_weighted(
+    w_11, w_21, w_12, w_22, value_11, value_21, value_12, value_22, z);
 }
@@ -51,3 +51,58 @@ bilinear_interp(const double x_1,
                 const double x,
                 const double y,
                 double* z);
+
+/**
+ @brief Computes the weights of the bilinear interpolation at a given point.
+
+ The weights depend only on the coordinates, they can be shared by all the
+ values interpolated at the same point in the same cell.
+
+ @param x_1 X-coordinate X1
+ @param x_2 X-coordinate X2
+ @param y_1 Y-coordinate Y1
+ @param y_2 Y-coordinate Y2
+ @param x X-coordinate of the point where the interpolation is carried out
+ @param y Y-coordinate of the point where the interpolation is carried out
+ @param w_11 Weight of the point (X1, Y1)
+ @param w_21 Weight of the point (X2, Y1)
+ @param w_12 Weight of the point (X1, Y2)
+ @param w_22 Weight of the point (X2, Y2)
+ */
+void
+bilinear_weights(const double x_1,
+                 const double x_2,
+                 const double y_1,
+                 const double y_2,
+                 const double x,
+                 const double y,
+                 double* w_11,
+                 double* w_21,
+                 double* w_12,
+                 double* w_22);
+
+/**
+ @brief Interpolate a value using the weights computed by #bilinear_weights.
+
+ @param w_11 Weight of the point (X1, Y1)
+ @param w_21 Weight of the point (X2, Y1)
+ @param w_12 Weight of the point (X1, Y2)
+ @param w_22 Weight of the point (X2, Y2)
+ @param value_11 Value of the point (X1, Y1)
+ @param value_21 Value of the point (X2, Y1)
+ @param value_12 Value of the point (X1, Y2)
+ @param value_22 Value of the point (X2, Y2)
+ @param z The interpolated value at the given point.
+
+ @return The number of points used in the interpolation
+ */
+int
+bilinear_interp_weighted(const double w_11,
+                         const double w_21,
+                         const double w_12,
+                         const double w_22,
+                         const double value_11,
+                         const double value_21,
+                         const double value_12,
+                         const double value_22,
+                         double* z);
@@ -841,21 +841,16 @@ set_w3rd(const fes_wave* const w, float w3rd[][N_COEFS])
 /*
  */
 void
-lpe_minus_n_waves(const float w2nd[][N_COEFS],
-                  const float w3rd[][N_COEFS],
-                  const double ts,
-                  const double lat,
-                  double* tlp)
+lpe_potential(const float w2nd[][N_COEFS],
+              const float w3rd[][N_COEFS],
+              const double ts,
+              double* h20,
+              double* h30)
 {
-
   int ix;
   double td;
   double shpn[5];
   double tmp;
-  double h20 = 0.0;
-  double h30 = 0.0;
-  double c20;
-  double c30;
 
   /* Compute 4 principal mean longitudes in radians at time TD */
   td = ((ts + 33282.0) * 86400.0 - 4043174400.0) / 86400.0;
@@ -867,12 +862,15 @@ lpe_minus_n_waves(const float w2nd[][N_COEFS],
   shpn[3] = RAD * fmod(343.510 + (td * 0.05295390), 360.0);  /* n  */
   shpn[4] = RAD * fmod(283.000 + (td * 0.00000000), 360.0);  /* p1 */
 
+  *h20 = 0.0;
+  *h30 = 0.0;
+
   /* Tidal potential V20 */
   for (ix = 0; ix < N_WAVES_2ND; ++ix) {
     tmp = w2nd[ix][0] * shpn[0] + w2nd[ix][1] * shpn[1] +
           w2nd[ix][2] * shpn[2] + w2nd[ix][3] * shpn[3] + w2nd[ix][4] * shpn[4];
 
-    h20 += cos(tmp) * w2nd[ix][5];
+    *h20 += cos(tmp) * w2nd[ix][5];
   }
 
   /* Tidal potential V30 */
@@ -880,10 +878,18 @@ lpe_minus_n_waves(const float w2nd[][N_COEFS],
     tmp = w3rd[ix][0] * shpn[0] + w3rd[ix][1] * shpn[1] +
           w3rd[ix][2] * shpn[2] + w3rd[ix][3] * shpn[3] + w3rd[ix][4] * shpn[4];
 
-    h30 += sin(tmp) * w3rd[ix][5];
+    *h30 += sin(tmp) * w3rd[ix][5];
   }
+}
 
-  tmp = sin(lat * RAD);
+/*
+ */
+double
+lpe_tide(const double h20, const double h30, const double lat)
+{
+  double tmp = sin(lat * RAD);
+  double c20;
+  double c30;
 
   /* FES14C: mass conservation for LP equil */
   /* subtraction of the mean of c20 and c30 on ocean, for mass conservation */
@@ -894,11 +900,27 @@ lpe_minus_n_waves(const float w2nd[][N_COEFS],
 
   /* m -> cm */
   /* clang-format off */
-  *tlp = ((1.0 - 0.609 /* H2 */+ 0.302 /* K2 */) * c20 * h20 + (1.0 - 0.291
+  return ((1.0 - 0.609 /* H2 */+ 0.302 /* K2 */) * c20 * h20 + (1.0 - 0.291
   /* H3 */+ 0.093 /* K3 */) * c30 * h30) * 1e2;
   /* clang-format on */
 }
 
+/*
+ */
+void
+lpe_minus_n_waves(const float w2nd[][N_COEFS],
+                  const float w3rd[][N_COEFS],
+                  const double ts,
+                  const double lat,
+                  double* tlp)
+{
+  double h20;
+  double h30;
+
+  lpe_potential(w2nd, w3rd, ts, &h20, &h30);
+  *tlp = lpe_tide(h20, h30, lat);
+}
+
 /*
  _frequency
 
@@ -105,6 +105,41 @@ lpe_minus_n_waves(const float w2nd[][N_COEFS],
                   const double lat,
                   double* tlp);
 
+/**
+ @brief Computes the order 2 and order 3 tidal potentials of the long-period
+ equilibrium ocean tides.
+
+ The potentials only depend on time: they can be reused to compute the
+ long-period tide at any latitude with lpe_tide.
+
+ @param w2nd Pointer to the array which contains waves order 2 definition.
+ @param w3rd Pointer to the array which contains waves order 3 definition.
+ @param ts Julian day, in seconds, denoting time at which tide is to be
+ computed.
+ @param h20 Computed tidal potential V20.
+ @param h30 Computed tidal potential V30.
+ */
+void
+lpe_potential(const float w2nd[][N_COEFS],
+              const float w3rd[][N_COEFS],
+              const double ts,
+              double* h20,
+              double* h30);
+
+/**
+ @brief Computes the long-period equilibrium ocean tides from the tidal
+ potentials computed by lpe_potential.
+
+ @param h20 Tidal potential V20.
+ @param h30 Tidal potential V30.
+ @param lat Latitude in degrees (positive north) for the position at which
+ tide is computed.
+
+ @return Computed long-period tide, in centimeters.
+ */
+double
+lpe_tide(const double h20, const double h30, const double lat);
+
 /**
  @brief Set Waves properties.
 
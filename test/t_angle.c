@@ -20,39 +20,53 @@
 #include "angle.h"
 #include "test.h"
 
+/* Fundamental frequency to check */
+typedef struct
+{
+  /* Name of the frequency */
+  const char* name;
+  /* Function computing the frequency */
+  double (*compute)(void);
+  /* Expected value */
+  double expected;
+} _frequency;
+
+/* Expected speeds, in degree by hour, and frequencies, in cycle by hour */
+static const _frequency _frequencies[] = {
+  { "tau_speed", tau_speed, 14.4920521070043 },
+  { "s_speed", s_speed, 0.5490165320557 },
+  { "h_speed", h_speed, 0.0410686390600 },
+  { "p_speed", p_speed, 0.0046418343600 },
+  { "n_speed", n_speed, -0.0022064134155 },
+  { "p1_speed", p1_speed, 0.00000196098563 },
+  { "tau_frequency", tau_frequency, 0.040255700297 },
+  { "s_frequency", s_frequency, 0.001525045922 },
+  { "h_frequency", h_frequency, 0.000114079553 },
+  { "p_frequency", p_frequency, 0.000012893984 },
+  { "n_frequency", n_frequency, -0.000006128926 },
+  { "p1_frequency", p1_frequency, 0.000000005447 },
+};
+
 int
 main(void)
 {
   int total_err = 0;
   int err;
+  size_t ix;
 
   printf("*** testing the fundamental frequencies\n");
 
-  err = CHECK_FLOAT(tau_speed(), 14.4920521070043);
-  SUMMARIZE_ERR;
-  err = CHECK_FLOAT(s_speed(), 0.5490165320557);
-  SUMMARIZE_ERR;
-  err = CHECK_FLOAT(h_speed(), 0.0410686390600);
-  SUMMARIZE_ERR;
-  err = CHECK_FLOAT(p_speed(), 0.0046418343600);
-  SUMMARIZE_ERR;
-  err = CHECK_FLOAT(n_speed(), -0.0022064134155);
-  SUMMARIZE_ERR;
-  err = CHECK_FLOAT(p1_speed(), 0.00000196098563);
-  SUMMARIZE_ERR;
-
-  err = CHECK_FLOAT(tau_frequency(), 0.040255700297);
-  SUMMARIZE_ERR;
-  err = CHECK_FLOAT(s_frequency(), 0.001525045922);
-  SUMMARIZE_ERR;
-  err = CHECK_FLOAT(h_frequency(), 0.000114079553);
-  SUMMARIZE_ERR;
-  err = CHECK_FLOAT(p_frequency(), 0.000012893984);
-  SUMMARIZE_ERR;
-  err = CHECK_FLOAT(n_frequency(), -0.000006128926);
-  SUMMARIZE_ERR;
-  err = CHECK_FLOAT(p1_frequency(), 0.000000005447);
-  SUMMARIZE_ERR;
+  for (ix = 0; ix < sizeof(_frequencies) / sizeof(_frequencies[0]); ++ix) {
+    double value = _frequencies[ix].compute();
+
+    err = CHECK_FLOAT(value, _frequencies[ix].expected);
+    if (err)
+      printf("%s: %.15g != %.15g\n",
+             _frequencies[ix].name,
+             value,
+             _frequencies[ix].expected);
+    SUMMARIZE_ERR;
+  }
 
   FINAL_RESULTS;
 }
@@ -30,8 +30,236 @@
 
 #define CHECK_TIDE(a, b, c) fabs((a) - (b)) > c
 
+/* Number of hourly values checked */
+#define N_HOURS 24
+
 static int total_err = 0;
 
+/* Expected tide, in cm, for each hour computed */
+static const double _expected_tide[N_HOURS] = {
+  -100.990629, -137.104223, -138.482412, -104.345361, -42.515586, 32.374755,
+  102.167627,  149.469495,  162.102726,  136.505573,  78.894879,  3.643044,
+  -70.661218,  -126.154394, -150.116619, -137.779885, -93.130691, -27.816052,
+  41.546661,   97.256195,   124.945282,  117.469330,  77.027699,  14.659386
+};
+
+/* Expected long-period tide, in cm, for each hour computed */
+static const double _expected_lp[N_HOURS] = {
+  0.916836, 0.890078, 0.862703, 0.834728, 0.806173, 0.777056,
+  0.747394, 0.717208, 0.686517, 0.655340, 0.623698, 0.591611,
+  0.559100, 0.526184, 0.492887, 0.459228, 0.425230, 0.390913,
+  0.356301, 0.321414, 0.286275, 0.250907, 0.215331, 0.179571
+};
+
+/* Expected loading tide, in cm, for each hour computed */
+static const double _expected_load[N_HOURS] = {
+  3.881161,  4.328335,  3.710694,  2.134257,  -0.052047, -2.341404,
+  -4.194242, -5.171971, -5.045669, -3.852375, -1.884925, 0.381964,
+  2.410565,  3.733913,  4.070741,  3.392764,  1.927624,  0.097163,
+  -1.592943, -2.683946, -2.881870, -2.132584, -0.635177, 1.209534
+};
+
+/* Compares a computed value with the expected one, describing any mismatch */
+static int
+_check_tide(const char* const name,
+            const int hour,
+            const double value,
+            const double expected)
+{
+  if (CHECK_TIDE(value, expected, 1E-5)) {
+    printf("%s at hour %d: %.6f != %.6f\n", name, hour, value, expected);
+    return 1;
+  }
+  return 0;
+}
+
+/* Positions evaluated at each date of _cached_dates */
+#define N_POINTS 4
+
+static const double _cached_lon[N_POINTS] = { -7.688, -10.5, -20.1, -30.4 };
+static const double _cached_lat[N_POINTS] = { 59.195, 55.3, 45.7, 40.2 };
+
+/* Position without data */
+static const double _land_lon = 2.35;
+static const double _land_lat = 48.85;
+
+/* Dates evaluated in turn by the same handler: the positions of a date share
+ * the values cached for it, the second date stays within the nodal
+ * corrections computed for the first one, the third moves them more than 24
+ * hours away and the last one goes back to the first date. */
+#define N_DATES 4
+
+static const double _cached_dates[N_DATES] = { 12053.25,
+                                               12053.75,
+                                               12055.25,
+                                               12053.25 };
+
+/* Compares a value computed by a handler reusing its cached values with the
+ * value computed without cache, describing any difference */
+static int
+_check_cached(const char* const name,
+              const int date,
+              const int point,
+              const double value,
+              const double expected)
+{
+  if (value != expected) {
+    printf("%s at date %d, point %d: %.17g != %.17g\n",
+           name,
+           date,
+           point,
+           value,
+           expected);
+    return 1;
+  }
+  return 0;
+}
+
+/* Checks that the values cached by a handler between two calls give the same
+ * results as a reference handler that never reuses them: after each position,
+ * the reference is evaluated one hour later, which discards the values cached
+ * for the date while keeping the same nodal corrections. */
+int
+test_cache(fes_enum_access access)
+{
+  int err;
+  int ix;
+  int jx;
+  int rc = 0;
+  double tide[N_DATES][N_POINTS];
+  double lp[N_DATES][N_POINTS];
+  double ref_tide;
+  double ref_lp;
+  double cached_tide;
+  double cached_lp;
+  double land_tide;
+  double land_lp;
+  FES fes = NULL;
+  FES ref = NULL;
+
+  printf("*** testing the values cached by libfes with %s...\n",
+         access == FES_IO ? "direct access" : "memory access");
+
+  if (fes_new(&fes, FES_TIDE, access, INI)) {
+    printf("fes error : %s\n", fes_error(fes));
+    goto on_error;
+  }
+
+  if (fes_new(&ref, FES_TIDE, access, INI)) {
+    printf("fes error : %s\n", fes_error(ref));
+    goto on_error;
+  }
+
+  for (ix = 0; ix < N_DATES; ++ix) {
+    for (jx = 0; jx < N_POINTS; ++jx) {
+      if (fes_core(fes,
+                   _cached_lat[jx],
+                   _cached_lon[jx],
+                   _cached_dates[ix],
+                   &tide[ix][jx],
+                   &lp[ix][jx])) {
+        fprintf(stderr, "%s\n", fes_error(fes));
+        goto on_error;
+      }
+
+      if (fes_core(ref,
+                   _cached_lat[jx],
+                   _cached_lon[jx],
+                   _cached_dates[ix],
+                   &ref_tide,
+                   &ref_lp)) {
+        fprintf(stderr, "%s\n", fes_error(ref));
+        goto on_error;
+      }
+
+      err = _check_cached("tide", ix, jx, tide[ix][jx], ref_tide);
+      err += _check_cached("lp", ix, jx, lp[ix][jx], ref_lp);
+      SUMMARIZE_ERR;
+
+      /* Discards the values cached by the reference for this date */
+      if (fes_core(ref,
+                   _cached_lat[jx],
+                   _cached_lon[jx],
+                   _cached_dates[ix] + 1 / 24.0,
+                   &ref_tide,
+                   &ref_lp)) {
+        fprintf(stderr, "%s\n", fes_error(ref));
+        goto on_error;
+      }
+    }
+  }
+
+  /* Going back to the first date gives the same results */
+  for (jx = 0; jx < N_POINTS; ++jx) {
+    err = _check_cached(
+      "tide", N_DATES - 1, jx, tide[N_DATES - 1][jx], tide[0][jx]);
+    err += _check_cached("lp", N_DATES - 1, jx, lp[N_DATES - 1][jx], lp[0][jx]);
+    SUMMARIZE_ERR;
+  }
+
+  /* A position without data updates the nodal corrections without computing
+   * the phases of the waves: the handler is evaluated at a date, 20 hours
+   * later, at a position without data 40 hours later and 20 hours later again.
+   * The phases computed the first time for the second date must not be reused
+   * with the new nodal corrections. */
+  for (ix = 0; ix < 2; ++ix) {
+    if (fes_core(fes,
+                 _cached_lat[0],
+                 _cached_lon[0],
+                 12060 + ix * 20 / 24.0,
+                 &cached_tide,
+                 &cached_lp)) {
+      fprintf(stderr, "%s\n", fes_error(fes));
+      goto on_error;
+    }
+  }
+  err = fes_core(
+          fes, _land_lat, _land_lon, 12060 + 40 / 24.0, &land_tide, &land_lp) !=
+          1 ||
+        fes_errno(fes) != FES_NO_DATA;
+  SUMMARIZE_ERR;
+  if (fes_core(fes,
+               _cached_lat[0],
+               _cached_lon[0],
+               12060 + 20 / 24.0,
+               &cached_tide,
+               &cached_lp)) {
+    fprintf(stderr, "%s\n", fes_error(fes));
+    goto on_error;
+  }
+
+  /* The reference computes its nodal corrections 40 hours after the date,
+   * then the phases 20 hours after it */
+  for (ix = 2; ix > 0; --ix) {
+    if (fes_core(ref,
+                 _cached_lat[0],
+                 _cached_lon[0],
+                 12060 + ix * 20 / 24.0,
+                 &ref_tide,
+                 &ref_lp)) {
+      fprintf(stderr, "%s\n", fes_error(ref));
+      goto on_error;
+    }
+  }
+  err = _check_cached("tide", N_DATES, 0, cached_tide, ref_tide);
+  err += _check_cached("lp", N_DATES, 0, cached_lp, ref_lp);
+  SUMMARIZE_ERR;
+
+  goto on_terminate;
+
+on_error:
+  rc = 1;
+
+on_terminate:
+  fes_delete(fes);
+  fes_delete(ref);
+
+  if (rc == 0) {
+    FINAL_RESULTS;
+  }
+  return rc;
+}
+
 int
 test(fes_enum_access access)
 {
@@ -63,7 +291,11 @@ test(fes_enum_access access)
     goto on_error;
   }
 
-  for (hour = 0, time = 12053; hour < 24; hour++, time += 1 / 24.0) {
+  for (hour = 0; hour < N_HOURS; hour++) {
+    /* Date of the hour, derived from the index to avoid accumulating rounding
+     * errors */
+    time = 12053 + hour / 24.0;
+
     /* Compute tide */
     if (fes_core(short_tide, lat, lon, time, &tide, &lp)) {
       if (fes_errno(short_tide) == FES_NO_DATA)
@@ -86,202 +318,10 @@ test(fes_enum_access access)
     err = fes_min_number(short_tide) < 0 || fes_min_number(short_tide) > 4;
     SUMMARIZE_ERR;
 
-    switch (hour) {
-      case 0:
-        err = CHECK_TIDE(tide, -100.990629, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.916836, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, 3.881161, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 1:
-        err = CHECK_TIDE(tide, -137.104223, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.890078, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, 4.328335, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 2:
-        err = CHECK_TIDE(tide, -138.482412, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.862703, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, 3.710694, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 3:
-        err = CHECK_TIDE(tide, -104.345361, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.834728, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, 2.134257, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 4:
-        err = CHECK_TIDE(tide, -42.515586, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.806173, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, -0.052047, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 5:
-        err = CHECK_TIDE(tide, 32.374755, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.777056, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, -2.341404, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 6:
-        err = CHECK_TIDE(tide, 102.167627, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.747394, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, -4.194242, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 7:
-        err = CHECK_TIDE(tide, 149.469495, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.717208, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, -5.171971, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 8:
-        err = CHECK_TIDE(tide, 162.102726, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.686517, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, -5.045669, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 9:
-        err = CHECK_TIDE(tide, 136.505573, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.655340, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, -3.852375, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 10:
-        err = CHECK_TIDE(tide, 78.894879, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.623698, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, -1.884925, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 11:
-        err = CHECK_TIDE(tide, 3.643044, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.591611, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, 0.381964, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 12:
-        err = CHECK_TIDE(tide, -70.661218, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.559100, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, 2.410565, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 13:
-        err = CHECK_TIDE(tide, -126.154394, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.526184, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, 3.733913, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 14:
-        err = CHECK_TIDE(tide, -150.116619, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.492887, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, 4.070741, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 15:
-        err = CHECK_TIDE(tide, -137.779885, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.459228, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, 3.392764, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 16:
-        err = CHECK_TIDE(tide, -93.130691, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.425230, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, 1.927624, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 17:
-        err = CHECK_TIDE(tide, -27.816052, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.390913, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, 0.097163, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 18:
-        err = CHECK_TIDE(tide, 41.546661, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.356301, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, -1.592943, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 19:
-        err = CHECK_TIDE(tide, 97.256195, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.321414, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, -2.683946, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 20:
-        err = CHECK_TIDE(tide, 124.945282, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.286275, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, -2.881870, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 21:
-        err = CHECK_TIDE(tide, 117.469330, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.250907, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, -2.132584, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 22:
-        err = CHECK_TIDE(tide, 77.027699, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.215331, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, -0.635177, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      case 23:
-        err = CHECK_TIDE(tide, 14.659386, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(lp, 0.179571, 1E-5);
-        SUMMARIZE_ERR;
-        err = CHECK_TIDE(load, 1.209534, 1E-5);
-        SUMMARIZE_ERR;
-        break;
-      default:
-        abort();
-    }
+    err = _check_tide("tide", hour, tide, _expected_tide[hour]);
+    err += _check_tide("lp", hour, lp, _expected_lp[hour]);
+    err += _check_tide("load", hour, load, _expected_load[hour]);
+    SUMMARIZE_ERR;
   }
 
   goto on_terminate;
@@ -318,5 +358,11 @@ main(void)
   err = test(FES_MEM);
   SUMMARIZE_ERR;
 
+  err = test_cache(FES_IO);
+  SUMMARIZE_ERR;
+
+  err = test_cache(FES_MEM);
+  SUMMARIZE_ERR;
+
   FINAL_RESULTS;
 }
@@ -53,14 +53,22 @@ main(void)
   SUMMARIZE_ERR;
   err = CHECK_FLOAT(_normalize_longitude(0.0, 10), 10);
   SUMMARIZE_ERR;
-
-  printf("*** testing _nearest_integer...\n");
-  err = CHECK_FLOAT(_nearest_integer(M_PI), 3);
+  err = CHECK_FLOAT(_normalize_longitude(0.0, 36000010), 10);
+  SUMMARIZE_ERR;
+  err = CHECK_FLOAT(_normalize_longitude(-180.0, -7190), 10);
+  SUMMARIZE_ERR;
+  /* Query longitudes below -360 used as the base to normalize the east
+   * longitude of the grid are more than two turns away from it. */
+  err = CHECK_FLOAT(_normalize_longitude(-365.0, 355.5), -364.5);
   SUMMARIZE_ERR;
 
   printf("*** testing _get_index...\n");
   err = CHECK_INT(_get_index(2, 3, 2), 0);
   SUMMARIZE_ERR;
+  err = CHECK_INT(_get_index(0, M_PI, 1), 3);
+  SUMMARIZE_ERR;
+  err = CHECK_INT(_get_index(-90, 89.999, 0.5), 359);
+  SUMMARIZE_ERR;
 
   printf("*** testing _get_value...\n");
   err = CHECK_FLOAT(_get_value(10, -90, 0.5), -85);
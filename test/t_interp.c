@@ -24,6 +24,7 @@ main(void)
 {
   int total_err = 0, err;
   double a, b;
+  double w_11, w_21, w_12, w_22;
 
   a = 2;
   b = 2;
@@ -67,5 +68,23 @@ main(void)
 
   SUMMARIZE_ERR;
 
+  printf("*** testing bilinear_weights...\n");
+  bilinear_weights(-1, 1, -1, 1, 0.5, 0, &w_11, &w_21, &w_12, &w_22);
+
+  err = w_11 != 0.125 || w_21 != 0.375 || w_12 != 0.125 || w_22 != 0.375;
+
+  SUMMARIZE_ERR;
+
+  printf("*** testing bilinear_interp_weighted...\n");
+  err = bilinear_interp_weighted(w_11, w_21, w_12, w_22, 0, 1, 1, 2, &a) != 4;
+  err += a != 1.25;
+
+  SUMMARIZE_ERR;
+
+  err = bilinear_interp_weighted(w_11, w_21, w_12, w_22, DV, 1, 1, DV, &a) != 2;
+  err += a != 1.0;
+
+  SUMMARIZE_ERR;
+
   FINAL_RESULTS;
 }
@@ -42,6 +42,51 @@ test_admittance(const double r, const int ix, fes_wave* w)
   return rc;
 }
 
+/* Long-period equilibrium tide, computed by lpe_minus_n_waves before its
+ * split into lpe_potential and lpe_tide, at the date 1 for each latitude. */
+#define N_LPE 9
+
+static const double _lpe_lat[N_LPE] = { -90.0, -60.0, -30.0, 0.0, 1.0,
+                                        30.0,  45.0,  60.0,  90.0 };
+static const double _lpe_expected[N_LPE] = { 2.503655820294,  1.528693439948,
+                                             -0.310214795327, -1.075166834819,
+                                             -1.069196011706, -0.145073818963,
+                                             0.653241736026,  1.406108056459,
+                                             2.126190731462 };
+
+/* The potential only depends on time: computed once, it gives the tide at
+ * every latitude. */
+static int
+test_lpe(void)
+{
+  int rc = 0;
+  int ix;
+  double h20;
+  double h30;
+  float w2nd[N_WAVES_2ND][N_COEFS];
+  float w3rd[N_WAVES_3RD][N_COEFS];
+  fes_wave w[N_WAVES];
+
+  set_waves(w);
+  w[MM].dynamic = 1;
+  w[MF].dynamic = 1;
+  w[MTM].dynamic = 1;
+  w[MSQM].dynamic = 1;
+
+  set_w2nd(w, w2nd);
+  set_w3rd(w, w3rd);
+
+  lpe_potential((const float(*)[N_COEFS])(w2nd),
+                (const float(*)[N_COEFS])(w3rd),
+                1,
+                &h20,
+                &h30);
+  for (ix = 0; ix < N_LPE; ++ix) {
+    rc += CHECK_FLOAT(lpe_tide(h20, h30, _lpe_lat[ix]), _lpe_expected[ix]);
+  }
+  return rc;
+}
+
 int
 main(void)
 {
@@ -54,6 +99,10 @@ main(void)
   _fes_astronomic_angle a;
   fes_wave w[N_WAVES];
 
+  printf("*** testing lpe_potential and lpe_tide\n");
+  err = test_lpe();
+  SUMMARIZE_ERR;
+
   set_waves(w);
 
   printf("*** testing wave properties\n");
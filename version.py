@@ -8,34 +8,41 @@ import sys
 
 PATTERN = "#define FES_VERSION"
 
+# Version number defined in the header file
+VERSION_RE = re.compile(PATTERN + r' "(.*)"')
+
+# Output of "git describe": tag, number of commits since the tag, commit and
+# state
+DESCRIBE_RE = re.compile(r'([\w\d\.]+)-(\d+)-g([\w\d]+)(?:-(dirty))?')
+
 
 def execute(cmd):
     """
     Executes a command and returns the lines displayed on the standard output
     """
-    process = subprocess.Popen(cmd,
-                               shell=True,
-                               stdout=subprocess.PIPE,
-                               stderr=subprocess.PIPE)
-    stdout = process.stdout.read()
-    if sys.version_info[0] == 3:
-        stdout = stdout.decode('utf8')
-    return stdout
+    process = subprocess.run(cmd,
+                             stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE,
+                             check=False)
+    return process.stdout.decode('utf8')
 
 
 def update_version(path, version, pattern, replaced_line):
     """Updating the version number description"""
     with open(path, "r") as stream:
         lines = stream.readlines()
-    pattern = re.compile(pattern)
+    regex = re.compile(pattern)
 
-    for idx, line in enumerate(lines):
-        match = pattern.search(line)
-        if match is not None:
-            lines[idx] = replaced_line % version
+    updated = [
+        line if regex.search(line) is None else replaced_line % version
+        for line in lines
+    ]
 
-    with open(path, "w") as stream:
-        stream.write("".join(lines))
+    # The file is left untouched if the version has not changed, so that its
+    # modification time does not trigger a new build.
+    if updated != lines:
+        with open(path, "w") as stream:
+            stream.write("".join(updated))
 
 
 def update_meta(path, version):
@@ -55,32 +62,22 @@ def revision(path, update=False):
     Creation of the file describing the library version.
     """
     if not update:
-        pattern = re.compile(PATTERN + r' "(.*)"').search
         with open(path, "r") as stream:
             for line in stream:
-                match = pattern(line)
+                match = VERSION_RE.search(line)
                 if match is not None:
                     return tuple(
                         int(item) for item in match.group(1).split("."))
 
-    stdout = execute("git describe --tags --dirty --long --always").strip()
-    pattern = re.compile(r'([\w\d\.]+)-(\d+)-g([\w\d]+)(?:-(dirty))?')
-    match = pattern.search(stdout)
+    stdout = execute(
+        ["git", "describe", "--tags", "--dirty", "--long", "--always"]).strip()
+    match = DESCRIBE_RE.search(stdout)
     assert match is not None
     (major, minor, patch) = (int(item) for item in match.group(1).split("."))
 
     if update:
-        with open(path, "r") as stream:
-            lines = stream.readlines()
-
-        for idx, line in enumerate(lines):
-            if PATTERN in line:
-                lines[idx] = PATTERN + " \"%d.%d.%d\"\n" % (major, minor,
-                                                            patch)
-
-        with open(path, "w") as stream:
-            stream.writelines(lines)
-
+        update_version(path, "%d.%d.%d" % (major, minor, patch), PATTERN,
+                       PATTERN + " \"%s\"\n")
         update_meta(
             os.path.join(os.path.dirname(os.path.abspath(__file__)),
                          "conda/meta.yaml"),